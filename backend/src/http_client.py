@@ -31,6 +31,27 @@ class CMCHTTPClient(HTTPClient):
             result = await resp.json()
             return result["data"][str(currency_id)]
 
+    @alru_cache(maxsize=128, ttl=60)
+    async def get_currencies(self, currency_ids: tuple[int, ...]):
+        """
+        Get quotes for several currencies in a single request
+
+        Args:
+            currency_ids: Sorted tuple of CoinMarketCap IDs (tuple so it can be cached)
+
+        Returns:
+            Dict mapping currency ID (str) to currency data
+        """
+        async with self.session.get(
+                "/v2/cryptocurrency/quotes/latest",
+                     params={"id": ",".join(str(i) for i in currency_ids)}
+        ) as resp:
+            result = await resp.json()
+            status = result.get("status", {})
+            if status.get("error_code"):
+                raise Exception(f"CoinMarketCap API error: {status.get('error_message')}")
+            return result["data"]
+
 
 class CoinGeckoClient:
     """CoinGecko API client for historical OHLC data"""
@@ -108,7 +129,7 @@ class KrakenClient:
         self.base_url = "https://api.kraken.com/0/public/"
         self.session = ClientSession(base_url=self.base_url)
 
-    @alru_cache(maxsize=128)
+    @alru_cache(maxsize=128, ttl=60)
     async def get_ohlc(self, pair: str, interval: int = 60):
         """
         Get OHLC data from Kraken
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Query
 from src.init import cmc_client, coingecko_client, kraken_client
 from src.coin_mapping import get_coingecko_id, get_kraken_symbol
@@ -6,12 +8,133 @@ router = APIRouter(
     prefix="/cryptocurrencies",
 )
 
+# Limits for the batched sparkline endpoint
+MAX_SPARKLINE_IDS = 100
+KRAKEN_CONCURRENCY = 5
+SPARKLINE_INTERVALS = {1, 5, 15, 30, 60, 240, 1440}
+
+# Bounds concurrent Kraken OHLC requests across all sparkline calls
+kraken_semaphore = asyncio.Semaphore(KRAKEN_CONCURRENCY)
+
+
+def downsample(values: list[float], points: int) -> list[float]:
+    """Pick `points` evenly spaced values, always keeping the first and last"""
+    if len(values) <= points:
+        return values
+    step = (len(values) - 1) / (points - 1)
+    return [values[round(i * step)] for i in range(points)]
+
+
+async def get_sparkline(kraken_pair: str, interval: int, points: int):
+    """
+    Get a downsampled close-price series for a Kraken pair
+
+    Caching happens in KrakenClient.get_ohlc (per pair and interval, with a TTL);
+    cache hits return immediately, so they only hold a semaphore slot briefly.
+    """
+    async with kraken_semaphore:
+        raw_data = await kraken_client.get_ohlc(pair=kraken_pair, interval=interval)
+
+    closes = [float(candle[4]) for candle in raw_data]
+    return {
+        "start": int(raw_data[0][0] * 1000) if raw_data else None,
+        "end": int(raw_data[-1][0] * 1000) if raw_data else None,
+        "closes": downsample(closes, points),
+    }
+
+
 @router.get("")
 async def get_cryptocurrencies():
     """Get list of top cryptocurrencies by market cap"""
     return await cmc_client.get_listings()
 
 
+@router.get("/sparklines")
+async def get_cryptocurrency_sparklines(
+    ids: str = Query(description="Comma-separated CoinMarketCap IDs (e.g. 1,1027)"),
+    interval: int = Query(default=60, description="Interval in minutes (1, 5, 15, 30, 60, 240, 1440)"),
+    points: int = Query(default=30, ge=2, le=200, description="Max number of points per series")
+):
+    """
+    Get compact close-price series for several cryptocurrencies in one request
+
+    Args:
+        ids: Comma-separated CoinMarketCap currency IDs
+        interval: Timeframe interval in minutes
+        points: Maximum number of close prices returned per currency
+
+    Returns:
+        Dict mapping currency ID to {symbol, kraken_pair, start, end, closes}.
+        Currencies that could not be fetched get "closes": null and an "error".
+    """
+    if interval not in SPARKLINE_INTERVALS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"interval must be one of {sorted(SPARKLINE_INTERVALS)}"
+        )
+
+    try:
+        currency_ids = tuple(sorted({int(i) for i in ids.split(",") if i.strip()}))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+
+    if not currency_ids:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    if len(currency_ids) > MAX_SPARKLINE_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_SPARKLINE_IDS} ids are allowed per request"
+        )
+
+    try:
+        # Resolve all symbols with a single CoinMarketCap request
+        currencies = await cmc_client.get_currencies(currency_ids)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch currency data: {str(e)}"
+        )
+
+    symbols = {
+        currency_id: currencies[str(currency_id)].get("symbol", "")
+        for currency_id in currency_ids
+        if str(currency_id) in currencies
+    }
+    kraken_pairs = {
+        currency_id: get_kraken_symbol(symbol)
+        for currency_id, symbol in symbols.items()
+    }
+
+    # Fetch each distinct pair once; failures are reported per currency
+    unique_pairs = sorted(set(kraken_pairs.values()))
+    results = await asyncio.gather(
+        *(get_sparkline(pair, interval, points) for pair in unique_pairs),
+        return_exceptions=True
+    )
+    sparklines = dict(zip(unique_pairs, results))
+
+    response = {}
+    for currency_id in currency_ids:
+        if currency_id not in kraken_pairs:
+            response[currency_id] = {"closes": None, "error": "Unknown currency"}
+            continue
+
+        kraken_pair = kraken_pairs[currency_id]
+        sparkline = sparklines[kraken_pair]
+        entry = {"symbol": symbols[currency_id], "kraken_pair": kraken_pair}
+        if isinstance(sparkline, Exception):
+            entry.update(closes=None, error=str(sparkline))
+        else:
+            entry.update(sparkline)
+        response[currency_id] = entry
+
+    return {
+        "interval": interval,
+        "points": points,
+        "data": response
+    }
+
+
 @router.get("/{currency_id}")
 async def get_cryptocurrency(currency_id: int):
     """Get detailed information about a specific cryptocurrency with high-quality image"""